@@ -1,29 +1,42 @@
 from __future__ import with_statement
+import sys
 import os.path
+from string import Template
 
-MODULE_TEMPLATE = """.. Autogenerated by genmods.py
+# CRUFT: python 2.7 backport of makedirs(path, exist_ok=False)
+if sys.version_info[0] >= 3:
+    from os import makedirs
+else:
+    def makedirs(path, exist_ok=False):
+        try:
+            os.makedirs(path)
+        except Exception:
+            if not exist_ok or not os.path.exists(path):
+                raise
+
+MODULE_TEMPLATE = Template(""".. Autogenerated by genmods.py
 
 ******************************************************************************
-%(name)s
+${name}
 ******************************************************************************
 
-:mod:`%(package)s.%(module)s`
+:mod:`${package}.${module}`
 ==============================================================================
 
-.. automodule:: %(package)s.%(module)s
+.. automodule:: ${package}.${module}
    :members:
    :undoc-members:
    :inherited-members:
    :show-inheritance:
 
-"""
+""")
 
-INDEX_TEMPLATE = """.. Autogenerated by genmods.py
+INDEX_TEMPLATE = Template(""".. Autogenerated by genmods.py
 
 .. _api-index:
 
 ##############################################################################
-   %(package_name)s
+   ${package_name}
 ##############################################################################
 
 .. only:: html
@@ -36,22 +49,45 @@ INDEX_TEMPLATE = """.. Autogenerated by genmods.py
    :numbered: 1
    :maxdepth: 2
 
-   %(rsts)s
-"""
+   ${rsts}
+""")
+
+
+def _write_file(path, text):
+    """
+    Write *text* to *path* using a single unbuffered write.
+
+    The file is left untouched if it already holds *text* so that sphinx
+    does not see a new mtime and rebuild the page.
+    """
+    data = text.encode('utf-8')
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, 'rb') as fid:
+                if fid.read() == data:
+                    return
+    except OSError:
+        pass
+    fd = os.open(path, os.O_WRONLY|os.O_CREAT|os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def genfiles(package, package_name, modules, dir='api'):
 
-    if not os.path.exists(dir):
-        os.makedirs(dir)
+    makedirs(dir, exist_ok=True)
 
     for module, name in modules:
-        with open(os.path.join(dir, module+'.rst'), 'w') as f:
-            f.write(MODULE_TEMPLATE%locals())
+        text = MODULE_TEMPLATE.substitute(
+            name=name, package=package, module=module)
+        _write_file(os.path.join(dir, module+'.rst'), text)
 
-    rsts = "\n   ".join(module+'.rst' for module, name in modules)
-    with open(os.path.join(dir, 'index.rst'), 'w') as f:
-        f.write(INDEX_TEMPLATE%locals())
+    rsts = "\n   ".join([module+'.rst' for module, _ in modules])
+    text = INDEX_TEMPLATE.substitute(package_name=package_name, rsts=rsts)
+    _write_file(os.path.join(dir, 'index.rst'), text)
 
 
 modules = [
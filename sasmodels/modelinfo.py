@@ -14,6 +14,12 @@ import inspect
 
 import numpy as np  # type: ignore
 
+# CRUFT: python 2.7 has intern as a builtin
+try:
+    from sys import intern
+except ImportError:
+    pass
+
 # Optional typing
 # pylint: disable=unused-import
 try:
@@ -153,6 +159,9 @@ def parse_parameter(name, units='', default=np.NaN,
         length = 1
         control = None
 
+    # Units and types repeat across all models, so share one copy of each.
+    units, ptype = intern(units), intern(ptype)
+
     # Build the parameter
     parameter = Parameter(name=name, units=units, default=default,
                           limits=limits, ptype=ptype, description=description)
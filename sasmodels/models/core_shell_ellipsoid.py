@@ -105,8 +105,10 @@ Authorship and Verification
 * **Last Reviewed by:** Steve King **Date:** March 27, 2019
 """
 
+from collections import namedtuple
+
 import numpy as np
-from numpy import inf, sin, cos, pi
+from numpy import inf
 
 name = "core_shell_ellipsoid"
 title = "Form factor for an spheroid ellipsoid particle with a core shell structure."
@@ -135,19 +137,21 @@ description = """
     """
 category = "shape:ellipsoid"
 
+Param = namedtuple('Param', 'name units default limits ptype description')
+
 # pylint: disable=bad-whitespace, line-too-long
-#             ["name", "units", default, [lower, upper], "type", "description"],
-parameters = [
-    ["radius_equat_core","Ang",     20,   [0, inf],   "volume",      "Equatorial radius of core"],
-    ["x_core",        "None",       3,   [0, inf],    "volume",      "axial ratio of core, X = r_polar/r_equatorial"],
-    ["thick_shell",   "Ang",       30,   [0, inf],    "volume",      "thickness of shell at equator"],
-    ["x_polar_shell", "",           1,   [0, inf],    "volume",      "ratio of thickness of shell at pole to that at equator"],
-    ["sld_core",      "1e-6/Ang^2", 2,   [-inf, inf], "sld",         "Core scattering length density"],
-    ["sld_shell",     "1e-6/Ang^2", 1,   [-inf, inf], "sld",         "Shell scattering length density"],
-    ["sld_solvent",   "1e-6/Ang^2", 6.3, [-inf, inf], "sld",         "Solvent scattering length density"],
-    ["theta",         "degrees",    0,   [-360, 360], "orientation", "elipsoid axis to beam angle"],
-    ["phi",           "degrees",    0,   [-360, 360], "orientation", "rotation about beam"],
-    ]
+#            "name",               "units",     default, (lower, upper), "type", "description"
+parameters = (
+    Param("radius_equat_core", "Ang",        20,  (0, inf),     "volume",      "Equatorial radius of core"),
+    Param("x_core",            "None",       3,   (0, inf),     "volume",      "axial ratio of core, X = r_polar/r_equatorial"),
+    Param("thick_shell",       "Ang",        30,  (0, inf),     "volume",      "thickness of shell at equator"),
+    Param("x_polar_shell",     "",           1,   (0, inf),     "volume",      "ratio of thickness of shell at pole to that at equator"),
+    Param("sld_core",          "1e-6/Ang^2", 2,   (-inf, inf),  "sld",         "Core scattering length density"),
+    Param("sld_shell",         "1e-6/Ang^2", 1,   (-inf, inf),  "sld",         "Shell scattering length density"),
+    Param("sld_solvent",       "1e-6/Ang^2", 6.3, (-inf, inf),  "sld",         "Solvent scattering length density"),
+    Param("theta",             "degrees",    0,   (-360, 360),  "orientation", "elipsoid axis to beam angle"),
+    Param("phi",               "degrees",    0,   (-360, 360),  "orientation", "rotation about beam"),
+    )
 # pylint: enable=bad-whitespace, line-too-long
 
 source = ["lib/sas_3j1x_x.c", "lib/gauss76.c", "core_shell_ellipsoid.c"]
@@ -179,10 +183,8 @@ def random():
     )
     return pars
 
-q = 0.1
 # tests had in old coords theta=0, phi=0; new coords theta=90, phi=0
-qx = q*cos(pi/6.0)
-qy = q*sin(pi/6.0)
+qx, qy = 0.1*np.cos(np.pi/6.0), 0.1*np.sin(np.pi/6.0)
 # 11Jan2017 RKH sorted tests after redefinition of angles
 tests = [
     # Accuracy tests based on content in test/utest_coreshellellipsoidXTmodel.py
@@ -230,3 +232,4 @@ tests = [
       'phi': 0.0,
      }, (qx, qy), 0.01000025],
 ]
+del qx, qy  # not necessary to delete, but cleaner
@@ -107,6 +107,8 @@ Authorship and Verification
 * **Last Reviewed by:**
 """
 
+from collections import namedtuple
+
 import numpy as np  # type: ignore
 from numpy import pi, inf  # type: ignore
 
@@ -129,20 +131,22 @@ description = """
 """
 category = "shape:cylinder"
 
-#             [ "name", "units", default, [lower, upper], "type", "description"],
-parameters = [["sld", "1e-6/Ang^2", 4, [-inf, inf], "sld",
-               "Cylinder scattering length density"],
-              ["sld_solvent", "1e-6/Ang^2", 1, [-inf, inf], "sld",
-               "Solvent scattering length density"],
-              ["radius", "Ang", 20, [0, inf], "volume",
-               "Cylinder radius"],
-              ["length", "Ang", 400, [0, inf], "volume",
-               "Cylinder length"],
-              ["theta", "degrees", 60, [-360, 360], "orientation",
-               "cylinder axis to beam angle"],
-              ["phi", "degrees", 60, [-360, 360], "orientation",
-               "rotation about beam"],
-             ]
+Param = namedtuple('Param', 'name units default limits ptype description')
+
+#                   "name", "units", default, (lower, upper), "type", "description"
+parameters = (Param("sld", "1e-6/Ang^2", 4, (-inf, inf), "sld",
+                    "Cylinder scattering length density"),
+              Param("sld_solvent", "1e-6/Ang^2", 1, (-inf, inf), "sld",
+                    "Solvent scattering length density"),
+              Param("radius", "Ang", 20, (0, inf), "volume",
+                    "Cylinder radius"),
+              Param("length", "Ang", 400, (0, inf), "volume",
+                    "Cylinder length"),
+              Param("theta", "degrees", 60, (-360, 360), "orientation",
+                    "cylinder axis to beam angle"),
+              Param("phi", "degrees", 60, (-360, 360), "orientation",
+                    "rotation about beam"),
+             )
 
 source = ["lib/polevl.c", "lib/sas_J1.c", "lib/gauss76.c", "cylinder.c"]
 valid = "radius >= 0.0 && length >= 0.0"
@@ -243,7 +247,7 @@ def _extend_with_reff_tests(radius, length):
     ])
 
 # Test Reff and volume with default model parameters
-_extend_with_reff_tests(parameters[2][2], parameters[3][2])
+_extend_with_reff_tests(parameters[2].default, parameters[3].default)
 del _extend_with_reff_tests
 
 # ADDED by:  RKH  ON: 18Mar2016 renamed sld's etc